@@ -18,14 +18,20 @@ __all__ = ['BosonicEnvironment',
 
 import abc
 import enum
+import functools
+from itertools import zip_longest
+import operator
 from time import time
+from types import MappingProxyType
 from typing import Any, Callable, Literal, Sequence, overload, Union
 import warnings
 
 import numpy as np
 from numpy.typing import ArrayLike
-from scipy.linalg import eigvalsh
+from scipy.linalg import eigvalsh_tridiagonal
 from scipy.interpolate import CubicSpline
+import scipy.fft
+from scipy.special import gamma
 
 try:
     from mpmath import mp
@@ -34,11 +40,59 @@ except ModuleNotFoundError:
     _mpmath_available = False
 
 from ..utilities import (n_thermal, iterated_fit, aaa,
-                         prony_methods, espira1, espira2)
+                         prony_methods, espira1, espira2, _vectorized_model)
 from .superoperator import spre, spost
 from .qobj import Qobj
 
 
+_PARAMS_CACHE_SIZE = 16
+
+
+def _params_key(value):
+    # numpy arrays, including 0-d ones, are not hashable
+    if isinstance(value, np.ndarray):
+        return (value.shape, value.dtype.str, value.tobytes())
+    return value
+
+
+def _cached_on_params(*attrs):
+    """
+    Decorator for methods whose result depends only on their arguments and on
+    the instance attributes listed in ``attrs``. The result is cached on the
+    instance, keyed on the arguments and the current values of the
+    attributes, so that reassigning one of the attributes invalidates it.
+    The cache holds at most ``_PARAMS_CACHE_SIZE`` entries per instance.
+
+    The decorated method must return a tuple. Since the cached tuple is shared
+    between all callers, the arrays in it are made read-only; callers that
+    need to modify them must copy them first.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            cache = self.__dict__.setdefault("_params_cache", {})
+            key = (method.__name__, args,
+                   tuple(_params_key(getattr(self, attr)) for attr in attrs))
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            except TypeError:
+                # unhashable arguments or parameters, such as lists, are not
+                # cached
+                return method(self, *args)
+            result = method(self, *args)
+            for item in result:
+                if isinstance(item, np.ndarray):
+                    item.setflags(write=False)
+            if len(cache) >= _PARAMS_CACHE_SIZE:
+                cache.clear()
+            cache[key] = result
+            return result
+        return wrapper
+    return decorator
+
+
 class BosonicEnvironment(abc.ABC):
     """
     The bosonic environment of an open quantum system. It is characterized by
@@ -310,47 +364,68 @@ class BosonicEnvironment(abc.ABC):
     # --- spectral density, power spectrum, correlation function conversions
 
     def _ps_from_sd(self, w, eps, derivative=None):
-        # derivative: value of J'(0)
+        # derivative: value of J'(0). Environments with an analytical spectral
+        # density pass it here (and eps=None), so that the whole frequency
+        # array is handled in a single pass without numerical differentiation
         if self.T is None:
             raise ValueError(
                 "The temperature must be specified for this operation.")
 
         w = np.asarray(w, dtype=float)
         if self.T == 0:
-            return 2 * np.heaviside(w, 0) * self.spectral_density(w)
+            # the spectral density is only evaluated where S is non-zero,
+            # user-supplied functions need not be defined elsewhere
+            positive_mask = (w > 0)
+            S = np.zeros_like(w)
+            S[positive_mask] = 2 * self.spectral_density(w[positive_mask])
+            return S.item() if w.ndim == 0 else S
 
         # at zero frequency, we do numerical differentiation
         # S(0) = 2 J'(0) / beta
+        # The spectral density is evaluated once on the full array, with the
+        # zero frequencies shifted to eps (where J(eps) is needed anyway).
         zero_mask = (w == 0)
-        nonzero_mask = np.invert(zero_mask)
+        w_safe = np.where(zero_mask, 1 if eps is None else eps, w)
+        J = self.spectral_density(np.abs(w_safe))
 
-        S = np.zeros_like(w)
+        S = 2 * np.sign(w_safe) * J * (self._n_thermal(w_safe) + 1)
         if derivative is None:
-            S[zero_mask] = 2 * self.T * self.spectral_density(eps) / eps
+            S = np.where(zero_mask, 2 * self.T * J / w_safe, S)
         else:
-            S[zero_mask] = 2 * self.T * derivative
-        S[nonzero_mask] = (
-            2 * np.sign(w[nonzero_mask])
-            * self.spectral_density(np.abs(w[nonzero_mask]))
-            * (n_thermal(w[nonzero_mask], self.T) + 1)
-        )
+            S = np.where(zero_mask, 2 * self.T * derivative, S)
         return S.item() if w.ndim == 0 else S
 
     def _sd_from_ps(self, w):
         w = np.asarray(w, dtype=float)
         J = np.zeros_like(w)
         positive_mask = (w > 0)
-        power_spectrum = self.power_spectrum(w[positive_mask])
+        w_positive = w[positive_mask]
+        power_spectrum = self.power_spectrum(w_positive)
 
         if self.T is None:
             raise ValueError(
                 "The temperature must be specified for this operation.")
 
         J[positive_mask] = (
-            power_spectrum / 2 / (n_thermal(w[positive_mask], self.T) + 1)
+            power_spectrum / 2 / (self._n_thermal(w_positive) + 1)
         )
         return J.item() if w.ndim == 0 else J
 
+    def _n_thermal(self, w):
+        # Solvers typically convert between the characteristic functions on
+        # the same frequency grid over and over, so the occupation numbers
+        # for the most recent grid are kept. Comparing the grid is much
+        # cheaper than the exponentials.
+        cached = self.__dict__.get("_n_thermal_cache")
+        if (
+            cached is not None and cached[0] == self.T
+            and np.array_equal(cached[1], w)
+        ):
+            return cached[2]
+        result = n_thermal(w, self.T)
+        self._n_thermal_cache = (self.T, np.array(w), result)
+        return result
+
     def _ps_from_cf(self, w, tMax):
         w = np.asarray(w, dtype=float)
         if w.ndim == 0:
@@ -360,7 +435,9 @@ class BosonicEnvironment(abc.ABC):
         else:
             wMax = max(np.abs(w[0]), np.abs(w[-1]))
 
-        mirrored_result = _fft(self.correlation_function, wMax, tMax=tMax)
+        mirrored_result = self._cached_fft(
+            ('cf', wMax, tMax), self.correlation_function, wMax, tMax
+        )
         result = np.real(mirrored_result(-w))
         return result.item() if w.ndim == 0 else result
 
@@ -373,11 +450,29 @@ class BosonicEnvironment(abc.ABC):
         else:
             tMax = max(np.abs(t[0]), np.abs(t[-1]))
 
-        result_fct = _fft(lambda w: self.power_spectrum(w, **ps_kwargs),
-                          tMax, tMax=wMax)
+        result_fct = self._cached_fft(
+            ('ps', tMax, wMax, tuple(sorted(ps_kwargs.items()))),
+            lambda w: self.power_spectrum(w, **ps_kwargs), tMax, wMax
+        )
         result = result_fct(t) / (2 * np.pi)
         return result.item() if t.ndim == 0 else result
 
+    def _cached_fft(self, key, f, wMax, tMax):
+        # Environments defined through numerical data keep a cache of the
+        # interpolated transforms, so that repeated evaluations on the same
+        # range do not recompute the FFT. The temperature is part of the key
+        # since the power spectrum of an environment defined through its
+        # spectral density depends on it.
+        cache = getattr(self, '_fft_cache', None)
+        if cache is None:
+            return _fft(f, wMax, tMax=tMax)
+        key = key + (self.T,)
+        if key not in cache:
+            if len(cache) >= _FFT_CACHE_SIZE:
+                cache.clear()
+            cache[key] = _fft(f, wMax, tMax=tMax)
+        return cache[key]
+
     # --- fitting
 
     @overload
@@ -459,20 +554,20 @@ class BosonicEnvironment(abc.ABC):
     ) -> tuple[ExponentialBosonicEnvironment, dict[str, Any]]:
         ...
 
-    @property
-    def _approximation_methods(self):
-        return {
-            "cf": (self._approx_by_cf_fit, "Correlation Function NLSQ"),
-            "ps": (self._approx_by_ps_fit, "Power Spectrum NLSQ"),
-            "sd": (self._approx_by_sd_fit, "Spectral Density NLSQ"),
-            "aaa": (self._approx_by_aaa, "Power spectrum AAA"),
-            "prony": (self._approx_by_prony, "Correlation Function Prony"),
-            "esprit": (self._approx_by_prony, "Correlation Function ESPRIT"),
-            "espira-i": (self._approx_by_prony,
-                         "Correlation Function ESPIRA-I"),
-            "espira-ii": (self._approx_by_prony,
-                          "Correlation Function ESPIRA-II"),
-        }
+    # Maps each method name to the name of the implementing method and a
+    # description. Shared by all instances; subclasses extend it.
+    _approximation_methods = MappingProxyType({
+        "cf": ("_approx_by_cf_fit", "Correlation Function NLSQ"),
+        "ps": ("_approx_by_ps_fit", "Power Spectrum NLSQ"),
+        "sd": ("_approx_by_sd_fit", "Spectral Density NLSQ"),
+        "aaa": ("_approx_by_aaa", "Power spectrum AAA"),
+        "prony": ("_approx_by_prony", "Correlation Function Prony"),
+        "esprit": ("_approx_by_prony", "Correlation Function ESPRIT"),
+        "espira-i": ("_approx_by_prony",
+                     "Correlation Function ESPIRA-I"),
+        "espira-ii": ("_approx_by_prony",
+                      "Correlation Function ESPIRA-II"),
+    })
 
     def approximate(self, method: str, *args, **kwargs):
         """
@@ -495,7 +590,7 @@ class BosonicEnvironment(abc.ABC):
                              " see the Users Guide.")
             raise ValueError(error_string)
 
-        func = dispatch[method.lower()][0]
+        func = getattr(self, dispatch[method.lower()][0])
         return func(method, *args, **kwargs)
 
     def _approx_by_cf_fit(
@@ -563,27 +658,12 @@ class BosonicEnvironment(abc.ABC):
                     "params_imag": params_imag, "summary": full_summary}
 
         # Finally, generate environment and return
-        ckAR = []
-        vkAR = []
-        for term in params_real:
-            if full_ansatz:
-                a, b, c, d = term
-            else:
-                a, b, c = term
-                d = 0
-            ckAR.extend([(a + 1j * d) / 2, (a - 1j * d) / 2])
-            vkAR.extend([-b - 1j * c, -b + 1j * c])
-
-        ckAI = []
-        vkAI = []
-        for term in params_imag:
-            if full_ansatz:
-                a, b, c, d = term
-            else:
-                a, b, c = term
-                d = 0
-            ckAI.extend([-1j * (a + 1j * d) / 2, 1j * (a - 1j * d) / 2])
-            vkAI.extend([-b - 1j * c, -b + 1j * c])
+        ck, vk = _cf_fit_exponents(params_real)
+        ckAR = _interleave(ck, ck.conj())
+        vkAR = _interleave(vk, vk.conj())
+        ck, vk = _cf_fit_exponents(params_imag)
+        ckAI = _interleave(-1j * ck, 1j * ck.conj())
+        vkAI = _interleave(vk, vk.conj())
 
         approx_env = ExponentialBosonicEnvironment(
             ckAR, vkAR, ckAI, vkAI, combine=combine, T=self.T, tag=tag)
@@ -684,13 +764,10 @@ class BosonicEnvironment(abc.ABC):
             "N": N, "fit_time": fit_time, "rmse": rmse,
             "params": params, "summary": summary}
 
-        ck, vk = [], []
         # Finally, generate environment and return
-        for a, b, c, d in params:
-            ck.append(a+1j*b)
-            vk.append(c+1j*d)
-        ck = np.array(ck)
-        vk = np.array(vk)
+        params = np.asarray(params)
+        ck = params[:, 0] + 1j * params[:, 1]
+        vk = params[:, 2] + 1j * params[:, 3]
         ckAR = np.concatenate((ck/2, ck.conj()/2))
         ckAI = np.concatenate((-1j*ck/2, 1j*ck.conj()/2))
         vkAR = np.concatenate((vk, vk.conj()))
@@ -848,6 +925,7 @@ class _BosonicEnvironment_fromCF(BosonicEnvironment):
         super().__init__(T, tag)
         self._cf = _complex_interpolation(
             C, tlist, 'correlation function', args)
+        self._fft_cache = {}
         if tlist is not None:
             self.tMax = max(np.abs(tlist[0]), np.abs(tlist[-1]))
         else:
@@ -855,14 +933,9 @@ class _BosonicEnvironment_fromCF(BosonicEnvironment):
 
     def correlation_function(self, t, **kwargs):
         t = np.asarray(t, dtype=float)
-        result = np.zeros_like(t, dtype=complex)
-        positive_mask = (t >= 0)
-        non_positive_mask = np.invert(positive_mask)
-
-        result[positive_mask] = self._cf(t[positive_mask])
-        result[non_positive_mask] = np.conj(
-            self._cf(-t[non_positive_mask])
-        )
+        # C(-t) = C(t)^*, so a single evaluation at |t| suffices
+        result = np.asarray(self._cf(np.abs(t)), dtype=complex)
+        result = np.where(t >= 0, result, np.conj(result))
         return result.item() if t.ndim == 0 else result
 
     def spectral_density(self, w):
@@ -879,6 +952,7 @@ class _BosonicEnvironment_fromPS(BosonicEnvironment):
     def __init__(self, S, wlist, wMax, T, tag, args):
         super().__init__(T, tag)
         self._ps = _real_interpolation(S, wlist, 'power spectrum', args)
+        self._fft_cache = {}
         if wlist is not None:
             self.wMax = max(np.abs(wlist[0]), np.abs(wlist[-1]))
         else:
@@ -903,6 +977,7 @@ class _BosonicEnvironment_fromSD(BosonicEnvironment):
     def __init__(self, J, wlist, wMax, T, tag, args):
         super().__init__(T, tag)
         self._sd = _real_interpolation(J, wlist, 'spectral density', args)
+        self._fft_cache = {}
         if wlist is not None:
             self.wMax = max(np.abs(wlist[0]), np.abs(wlist[-1]))
         else:
@@ -1016,10 +1091,11 @@ class DrudeLorentzEnvironment(BosonicEnvironment):
         Nk = Nk or self.Nk
         ck_real, vk_real, ck_imag, vk_imag = self._pade_params(Nk)
 
-        def C(c, v):
-            return np.sum([ck * np.exp(-np.asarray(vk * abs_t))
-                           for ck, vk in zip(c, v)], axis=0)
-        result = C(ck_real, vk_real) + 1j * C(ck_imag, vk_imag)
+        # The single imaginary exponent coincides with the first real one, so
+        # both parts are summed in one pass over the same exponentials
+        ck = ck_real.astype(complex)
+        ck[0] += 1j * ck_imag[0]
+        result = _exp_sum(ck, vk_real, abs_t)
 
         result = np.asarray(result, dtype=complex)
         result[t < 0] = np.conj(result[t < 0])
@@ -1146,13 +1222,11 @@ class DrudeLorentzEnvironment(BosonicEnvironment):
 
     # endregion
 
-    @property
-    def _approximation_methods(self):
-        return {
-            **super()._approximation_methods,
-            "matsubara": (self._approx_by_matsubara, "Matsubara Truncation"),
-            "pade": (self._approx_by_pade, "Pade Truncation")
-        }
+    _approximation_methods = MappingProxyType({
+        **BosonicEnvironment._approximation_methods,
+        "matsubara": ("_approx_by_matsubara", "Matsubara Truncation"),
+        "pade": ("_approx_by_pade", "Pade Truncation")
+    })
 
     def approximate(self, method: str, *args, **kwargs):
         """
@@ -1216,24 +1290,28 @@ class DrudeLorentzEnvironment(BosonicEnvironment):
 
         # There is only one term in the expansion of the imaginary part of the
         # Drude-Lorentz correlation function.
-        ck_imag = [-self.lam * self.gamma]
-        vk_imag = [self.gamma]
+        ck_imag = np.array([-self.lam * self.gamma])
+        vk_imag = np.array([self.gamma])
 
         return ck_real, vk_real, ck_imag, vk_imag
 
+    @_cached_on_params("T", "lam", "gamma")
     def _matsubara_params(self, Nk):
-        """ Calculate the Matsubara coefficients and frequencies. """
-        ck_real = [self.lam * self.gamma / np.tan(self.gamma / (2 * self.T))]
-        ck_real.extend([
-            (8 * self.lam * self.gamma * self.T * np.pi * k * self.T /
-                ((2 * np.pi * k * self.T)**2 - self.gamma**2))
-            for k in range(1, Nk + 1)
-        ])
-        vk_real = [self.gamma]
-        vk_real.extend([2 * np.pi * k * self.T for k in range(1, Nk + 1)])
-
-        ck_imag = [-self.lam * self.gamma]
-        vk_imag = [self.gamma]
+        """
+        Calculate the Matsubara coefficients and frequencies. The returned
+        arrays are cached and read-only.
+        """
+        k = np.arange(1, Nk + 1, dtype=float)
+        nu = 2 * np.pi * k * self.T
+
+        ck_real = np.concatenate((
+            [self.lam * self.gamma / np.tan(self.gamma / (2 * self.T))],
+            4 * self.lam * self.gamma * self.T * nu / (nu**2 - self.gamma**2)
+        ))
+        vk_real = np.concatenate(([self.gamma], nu))
+
+        ck_imag = np.array([-self.lam * self.gamma])
+        vk_imag = np.array([self.gamma])
 
         return ck_real, vk_real, ck_imag, vk_imag
 
@@ -1241,67 +1319,45 @@ class DrudeLorentzEnvironment(BosonicEnvironment):
 
     def _corr(self, Nk):
         kappa, epsilon = self._kappa_epsilon(Nk)
+        kappa = kappa[1:]
+        epsilon = epsilon[1:]
 
-        eta_p = [self.lam * self.gamma *
-                 self._cot(self.gamma / (2 * self.T))]
-        gamma_p = [self.gamma]
-
-        for ll in range(1, Nk + 1):
-            eta_p.append(
-                (kappa[ll] * self.T) * 4 * self.lam *
-                self.gamma * (epsilon[ll] * self.T)
-                / ((epsilon[ll]**2 * self.T**2) - self.gamma**2)
-            )
-            gamma_p.append(epsilon[ll] * self.T)
+        eta_p = np.concatenate((
+            [self.lam * self.gamma * self._cot(self.gamma / (2 * self.T))],
+            (kappa * self.T) * 4 * self.lam * self.gamma * (epsilon * self.T)
+            / ((epsilon**2 * self.T**2) - self.gamma**2)
+        ))
+        gamma_p = np.concatenate(([self.gamma], epsilon * self.T))
 
         return eta_p, gamma_p
 
     def _cot(self, x):
         return 1. / np.tan(x)
 
+    @_cached_on_params()
     def _kappa_epsilon(self, Nk):
         eps = self._calc_eps(Nk)
         chi = self._calc_chi(Nk)
 
-        kappa = [0]
         prefactor = 0.5 * Nk * (2 * (Nk + 1) + 1)
-        for j in range(Nk):
-            term = prefactor
-            for k in range(Nk - 1):
-                term *= (
-                    (chi[k]**2 - eps[j]**2) /
-                    (eps[k]**2 - eps[j]**2 + self._delta(j, k))
-                )
-            for k in [Nk - 1]:
-                term /= (eps[k]**2 - eps[j]**2 + self._delta(j, k))
-            kappa.append(term)
-
-        epsilon = [0] + eps
+        kappa = np.concatenate(([0], _pade_kappa(eps, chi, prefactor)))
+        epsilon = np.concatenate(([0], eps))
 
         return kappa, epsilon
 
-    def _delta(self, i, j):
-        return 1.0 if i == j else 0.0
-
     def _calc_eps(self, Nk):
-        alpha = np.diag([
-            1. / np.sqrt((2 * k + 5) * (2 * k + 3))
-            for k in range(2 * Nk - 1)
-        ], k=1)
-        alpha += alpha.transpose()
-        evals = eigvalsh(alpha)
-        eps = [-2. / val for val in evals[0: Nk]]
-        return eps
+        k = np.arange(2 * Nk - 1)
+        evals = _smallest_eigvals_offdiag(
+            1. / np.sqrt((2 * k + 5) * (2 * k + 3)), Nk
+        )
+        return -2. / evals
 
     def _calc_chi(self, Nk):
-        alpha_p = np.diag([
-            1. / np.sqrt((2 * k + 7) * (2 * k + 5))
-            for k in range(2 * Nk - 2)
-        ], k=1)
-        alpha_p += alpha_p.transpose()
-        evals = eigvalsh(alpha_p)
-        chi = [-2. / val for val in evals[0: Nk - 1]]
-        return chi
+        k = np.arange(2 * Nk - 2)
+        evals = _smallest_eigvals_offdiag(
+            1. / np.sqrt((2 * k + 7) * (2 * k + 5)), Nk - 1
+        )
+        return -2. / evals
 
     def approx_by_matsubara(self, *args, **kwargs):
         # TODO remove by 5.3
@@ -1516,12 +1572,10 @@ class UnderDampedEnvironment(BosonicEnvironment):
 
     # endregion
 
-    @property
-    def _approximation_methods(self):
-        return {
-            **super()._approximation_methods,
-            "matsubara": (self._approx_by_matsubara, "Matsubara Truncation")
-        }
+    _approximation_methods = MappingProxyType({
+        **BosonicEnvironment._approximation_methods,
+        "matsubara": ("_approx_by_matsubara", "Matsubara Truncation")
+    })
 
     def approximate(self, method: str, *args, **kwargs):
         """
@@ -1554,7 +1608,10 @@ class UnderDampedEnvironment(BosonicEnvironment):
         return approx_env, delta
 
     def _matsubara_params(self, Nk):
-        """ Calculate the Matsubara coefficients and frequencies. """
+        """
+        Calculate the Matsubara coefficients and frequencies. The returned
+        arrays are cached and read-only, see `_matsubara_terms`.
+        """
 
         if Nk > 0 and self.T == 0:
             warnings.warn("The Matsubara expansion cannot be performed at "
@@ -1562,37 +1619,39 @@ class UnderDampedEnvironment(BosonicEnvironment):
                           "fitting the correlation function.")
             Nk = 0
 
+        return self._matsubara_terms(Nk)
+
+    @_cached_on_params("T", "lam", "gamma", "w0")
+    def _matsubara_terms(self, Nk):
+        """
+        The Matsubara coefficients and frequencies for `Nk` terms. The
+        returned arrays are shared between calls and therefore read-only.
+        """
         Om = np.sqrt(self.w0**2 - (self.gamma / 2)**2)
         Gamma = self.gamma / 2
+        prefactor = self.lam**2 / (4 * Om)
+        OmG_plus2 = (Om + 1j * Gamma)**2
+        OmG_minus2 = (Om - 1j * Gamma)**2
 
         z = np.inf if self.T == 0 else (Om + 1j * Gamma) / (2 * self.T)
         # we set the argument of the hyperbolic tangent to infinity if T=0
-        ck_real = ([
-            (self.lam**2 / (4 * Om)) * (1 / np.tanh(z)),
-            (self.lam**2 / (4 * Om)) * (1 / np.tanh(np.conjugate(z))),
-        ])
-
-        ck_real.extend([
-            (-2 * self.lam**2 * self.gamma * self.T) * (2 * np.pi * k * self.T)
-            / (
-                ((Om + 1j * Gamma)**2 + (2 * np.pi * k * self.T)**2)
-                * ((Om - 1j * Gamma)**2 + (2 * np.pi * k * self.T)**2)
+        # coth(z^*) = coth(z)^*, so only one hyperbolic function is needed
+        coth_z = 1 / np.tanh(z)
+        k = np.arange(1, Nk + 1, dtype=float)
+        nu = 2 * np.pi * k * self.T
+        nu2 = nu**2
+
+        ck_real = np.concatenate((
+            [prefactor * coth_z, prefactor * np.conjugate(coth_z)],
+            (-2 * self.lam**2 * self.gamma * self.T) * nu / (
+                (OmG_plus2 + nu2) * (OmG_minus2 + nu2)
             )
-            for k in range(1, Nk + 1)
-        ])
+        ))
 
-        vk_real = [-1j * Om + Gamma, 1j * Om + Gamma]
-        vk_real.extend([
-            2 * np.pi * k * self.T
-            for k in range(1, Nk + 1)
-        ])
+        vk_imag = np.array([-1j * Om + Gamma, 1j * Om + Gamma])
+        vk_real = np.concatenate((vk_imag, nu))
 
-        ck_imag = [
-            1j * self.lam**2 / (4 * Om),
-            -1j * self.lam**2 / (4 * Om),
-        ]
-
-        vk_imag = [-1j * Om + Gamma, 1j * Om + Gamma]
+        ck_imag = np.array([1j * prefactor, -1j * prefactor])
 
         return ck_real, vk_real, ck_imag, vk_imag
 
@@ -1614,7 +1673,9 @@ class OhmicEnvironment(BosonicEnvironment):
         J(\omega)
         = \alpha \frac{\omega^s}{\omega_c^{s-1}} e^{-\omega / \omega_c} .
 
-    This class requires the `mpmath` module to be installed.
+    At finite temperature and for `s <= -1` or `s = 0`, the correlation
+    function is evaluated with the `mpmath` module, which must then be
+    installed. All other operations do not require `mpmath`.
 
     Parameters
     ----------
@@ -1643,10 +1704,11 @@ class OhmicEnvironment(BosonicEnvironment):
         self.wc = wc
         self.s = s
 
-        if _mpmath_available is False:
+        if _mpmath_available is False and (s <= -1 or s == 0):
             warnings.warn(
-                "The mpmath module is required for some operations on "
-                "Ohmic environments, but it is not installed.")
+                "The mpmath module is required for the correlation function "
+                "of Ohmic environments with s <= -1 or s = 0, but it is not "
+                "installed.")
 
     def spectral_density(self, w: float | ArrayLike) -> (float | ArrayLike):
         r"""
@@ -1663,10 +1725,14 @@ class OhmicEnvironment(BosonicEnvironment):
 
         positive_mask = (w > 0)
         w_mask = w[positive_mask]
+        if float(self.s).is_integer():
+            power_exp = w_mask ** self.s * np.exp(-w_mask / self.wc)
+        else:
+            # for non-integer s, w**s is itself an exp(s log w), so both
+            # factors can share a single exponential
+            power_exp = np.exp(self.s * np.log(w_mask) - w_mask / self.wc)
         result[positive_mask] = (
-            self.alpha * w_mask ** self.s
-            / (self.wc ** (self.s - 1))
-            * np.exp(-np.abs(w_mask) / self.wc)
+            self.alpha / (self.wc ** (self.s - 1)) * power_exp
         )
 
         return result.item() if w.ndim == 0 else result
@@ -1718,19 +1784,30 @@ class OhmicEnvironment(BosonicEnvironment):
             t = np.array([t], dtype=float)
 
         if self.T != 0:
+            # C(-t) = C(t)^*, so the zeta functions only need to be evaluated
+            # once for every distinct value of |t|
+            abs_t, inverse = np.unique(np.abs(t), return_inverse=True)
             corr = (self.alpha * self.wc ** (1 - self.s) / np.pi
-                    * mp.gamma(self.s + 1) * self.T ** (self.s + 1))
-            z1_u = ((1 + self.wc / self.T - 1j * self.wc * t)
+                    * gamma(self.s + 1) * self.T ** (self.s + 1))
+            z1_u = ((1 + self.wc / self.T - 1j * self.wc * abs_t)
                     / (self.wc / self.T))
-            z2_u = (1 + 1j * self.wc * t) / (self.wc / self.T)
-            result = np.asarray(
-                [corr * (mp.zeta(self.s + 1, u1) + mp.zeta(self.s + 1, u2))
-                 for u1, u2 in zip(z1_u, z2_u)],
-                dtype=np.cdouble
-            )
+            z2_u = (1 + 1j * self.wc * abs_t) / (self.wc / self.T)
+            if self.s > -1 and self.s != 0:
+                # Both zeta arguments have a positive real part, so the
+                # vectorized Euler-Maclaurin evaluation applies
+                zeta_sum = (_hurwitz_zeta(self.s + 1, z1_u)
+                            + _hurwitz_zeta(self.s + 1, z2_u))
+            else:
+                zeta_sum = np.asarray(
+                    [mp.zeta(self.s + 1, u1) + mp.zeta(self.s + 1, u2)
+                     for u1, u2 in zip(z1_u, z2_u)],
+                    dtype=np.cdouble
+                )
+            result = corr * zeta_sum[inverse.reshape(t.shape)]
+            result = np.where(t < 0, np.conj(result), result)
         else:
             corr = (self.alpha * self.wc**2 / np.pi
-                    * mp.gamma(self.s + 1)
+                    * gamma(self.s + 1)
                     * (1 + 1j * self.wc * t) ** (-self.s - 1))
             result = np.asarray(corr, dtype=np.cdouble)
 
@@ -1787,12 +1864,19 @@ class CFExponent:
     exponent : complex
         The frequency of the exponent of the excitation term. (Alias for `vk`.)
 
-    All of the parameters are also available as attributes.
+    All of the parameters are also available as attributes. The coefficient
+    is computed once when the exponent is created; use :meth:`rescale` to
+    obtain an exponent with different coefficients.
     """
     types = enum.Enum("ExponentType", ["R", "I", "RI", "+", "-"])
+    # enum members, for fast identity comparisons
+    _R, _I, _RI, _PLUS, _MINUS = types
+
+    __slots__ = ("type", "ck", "vk", "ck2", "tag", "fermionic",
+                 "_coefficient")
 
     def _check_ck2(self, type, ck2):
-        if type == self.types["RI"]:
+        if type is self._RI:
             if ck2 is None:
                 raise ValueError("RI exponents require ck2")
         else:
@@ -1803,7 +1887,7 @@ class CFExponent:
                 )
 
     def _type_is_fermionic(self, type):
-        return type in (self.types["+"], self.types["-"])
+        return type in (self._PLUS, self._MINUS)
 
     def __init__(
             self, type: str | CFExponent.ExponentType,
@@ -1821,10 +1905,17 @@ class CFExponent:
         self.tag = tag
         self.fermionic = self._type_is_fermionic(type)
 
+        if type is self._I:
+            self._coefficient = 1j * ck
+        elif type is self._RI:
+            self._coefficient = ck + 1j * ck2
+        else:
+            self._coefficient = ck
+
     def rescale(self, alpha: float) -> CFExponent:
         """Rescale the coefficient of the exponent by a factor of alpha."""
         ck_new = self.ck * alpha
-        if self.type == self.types["RI"]:
+        if self.type is self._RI:
             ck2_new = self.ck2 * alpha
         else:
             ck2_new = None
@@ -1842,14 +1933,7 @@ class CFExponent:
 
     @property
     def coefficient(self) -> complex:
-        coeff = 0
-        if self.type != self.types['I']:
-            coeff += self.ck
-        else:
-            coeff += 1j * self.ck
-        if self.type == self.types['RI']:
-            coeff += 1j * self.ck2
-        return coeff
+        return self._coefficient
 
     @property
     def exponent(self) -> complex:
@@ -1860,7 +1944,11 @@ class CFExponent:
             return False
         if self.fermionic or other.fermionic:
             return False
-        if not np.isclose(self.vk, other.vk, rtol=rtol, atol=atol):
+        # same criterion as np.isclose, without the array overhead
+        if not (
+            self.vk == other.vk
+            or abs(self.vk - other.vk) <= atol + rtol * abs(other.vk)
+        ):
             return False
         return True
 
@@ -1868,7 +1956,7 @@ class CFExponent:
         # Assumes can combine was checked
         cls = type(self)
 
-        if self.type == other.type and self.type != self.types['RI']:
+        if self.type is other.type and self.type is not self._RI:
             # Both R or both I
             return cls(type=self.type, ck=(self.ck + other.ck),
                        vk=self.vk, tag=self.tag, **init_kwargs)
@@ -1877,14 +1965,14 @@ class CFExponent:
         real_part_coefficient = 0
         imag_part_coefficient = 0
         for exp in [self, other]:
-            if exp.type == self.types['RI'] or exp.type == self.types['R']:
+            if exp.type is self._RI or exp.type is self._R:
                 real_part_coefficient += exp.ck
-            if exp.type == self.types['I']:
+            if exp.type is self._I:
                 imag_part_coefficient += exp.ck
-            if exp.type == self.types['RI']:
+            if exp.type is self._RI:
                 imag_part_coefficient += exp.ck2
 
-        return cls(type=self.types['RI'], ck=real_part_coefficient, vk=self.vk,
+        return cls(type=self._RI, ck=real_part_coefficient, vk=self.vk,
                    ck2=imag_part_coefficient, tag=self.tag, **init_kwargs)
 
 
@@ -1979,9 +2067,11 @@ class ExponentialBosonicEnvironment(BosonicEnvironment):
 
         exponents = exponents or []
         if lists_provided:
-            exponents.extend(self._make_exponent("R", ck, vk, tag=tag)
+            # the types are looked up once rather than for every exponent
+            R, I = CFExponent.types["R"], CFExponent.types["I"]
+            exponents.extend(self._make_exponent(R, ck, vk, tag=tag)
                              for ck, vk in zip(ck_real, vk_real))
-            exponents.extend(self._make_exponent("I", ck, vk, tag=tag)
+            exponents.extend(self._make_exponent(I, ck, vk, tag=tag)
                              for ck, vk in zip(ck_imag, vk_imag))
 
         if combine:
@@ -2013,15 +2103,25 @@ class ExponentialBosonicEnvironment(BosonicEnvironment):
         list of :class:`CFExponent`
             The new reduced list of exponents.
         """
-        remaining = exponents[:]
+        exponents = list(exponents)
+        vks = np.array([exp.vk for exp in exponents], dtype=complex)
+        used = np.zeros(len(exponents), dtype=bool)
         new_exponents = []
 
-        while remaining:
-            new_exponent = remaining.pop(0)
-            for other_exp in remaining[:]:
-                if new_exponent._can_combine(other_exp, rtol, atol):
-                    new_exponent = new_exponent._combine(other_exp)
-                    remaining.remove(other_exp)
+        for i, new_exponent in enumerate(exponents):
+            if used[i]:
+                continue
+            # Only exponents with a close frequency can be combined, so the
+            # (possibly more specific) _can_combine check is only run on
+            # those candidates
+            candidates = i + 1 + np.flatnonzero(
+                ~used[i + 1:]
+                & np.isclose(vks[i], vks[i + 1:], rtol=rtol, atol=atol)
+            )
+            for j in candidates:
+                if new_exponent._can_combine(exponents[j], rtol, atol):
+                    new_exponent = new_exponent._combine(exponents[j])
+                    used[j] = True
             new_exponents.append(new_exponent)
 
         return new_exponents
@@ -2040,10 +2140,14 @@ class ExponentialBosonicEnvironment(BosonicEnvironment):
         """
 
         t = np.asarray(t, dtype=float)
-        corr = np.zeros_like(t, dtype=complex)
+        abs_t = np.abs(t)
+        ck, vk = self._coefficients_and_exponents()
 
-        for exp in self.exponents:
-            corr += exp.coefficient * np.exp(-exp.exponent * np.abs(t))
+        exponentials = self._exponential_matrix(vk, abs_t)
+        if exponentials is None:
+            corr = np.asarray(_exp_sum(ck, vk, abs_t), dtype=complex)
+        else:
+            corr = (ck @ exponentials).reshape(t.shape)
         corr[t < 0] = np.conj(corr[t < 0])
 
         return corr.item() if t.ndim == 0 else corr
@@ -2062,15 +2166,37 @@ class ExponentialBosonicEnvironment(BosonicEnvironment):
         """
 
         w = np.asarray(w, dtype=float)
-        S = np.zeros_like(w)
+        ck, vk = self._coefficients_and_exponents()
 
-        for exp in self.exponents:
-            S += 2 * np.real(
-                exp.coefficient / (exp.exponent - 1j * w)
-            )
+        S = 2 * np.real(_pole_sum(ck, vk, w))
 
         return S.item() if w.ndim == 0 else S
 
+    def _exponential_matrix(self, vk, abs_t):
+        # Returns the matrix exp(-vk * |t|) if it is small enough to be kept,
+        # reusing the one from the previous call if the exponents and times
+        # are unchanged (e.g., when the correlation function is evaluated
+        # repeatedly on the same time grid). Returns None for large grids.
+        if len(vk) * abs_t.size > _EXP_SUM_BLOCK_SIZE:
+            return None
+        cached = self.__dict__.get("_exponential_cache")
+        if (
+            cached is not None
+            and np.array_equal(cached[0], vk)
+            and np.array_equal(cached[1], abs_t)
+        ):
+            return cached[2]
+        exponentials = np.exp(-np.multiply.outer(vk, abs_t.ravel()))
+        self._exponential_cache = (vk, abs_t.copy(), exponentials)
+        return exponentials
+
+    def _coefficients_and_exponents(self):
+        # The exponents are read on every call (rather than once in
+        # __init__) since the list may be replaced after construction, e.g.
+        # by the HEOM baths
+        _, ck, vk = _exponent_arrays(self, self.exponents)
+        return ck, vk
+
     def spectral_density(self, w: float | ArrayLike) -> (float | ArrayLike):
         """
         Calculates the spectral density corresponding to the multi-exponential
@@ -2143,6 +2269,173 @@ def system_terminator(Q: Qobj, delta: float) -> Qobj:
 
 # --- utility functions ---
 
+# Maximum number of elements of the intermediate (exponents x times) array
+# created by `_exp_sum` at once
+_EXP_SUM_BLOCK_SIZE = 2**18
+
+
+def _exp_sum(ck, vk, abs_t):
+    r"""
+    Evaluates :math:`\sum_k c_k e^{-v_k |t|}` for all given times. The
+    exponentials are computed block-wise over the times so that the
+    intermediate array of shape ``(len(ck), block)`` stays small even for
+    expansions with many terms.
+    """
+    vk = np.asarray(vk)
+    return _blocked_outer_sum(
+        ck, -np.asarray(vk, dtype=np.result_type(vk, 1.)), abs_t,
+        np.multiply.outer, np.exp
+    )
+
+
+def _pole_sum(ck, vk, w):
+    r"""
+    Evaluates :math:`\sum_k c_k / (v_k - i \omega)` for all given
+    frequencies, block-wise like :func:`_exp_sum`.
+    """
+    w = np.asarray(w, dtype=float)
+    return _blocked_outer_sum(
+        ck, np.asarray(vk, dtype=complex), -1j * w, np.add.outer, np.reciprocal
+    )
+
+
+def _blocked_outer_sum(ck, vk, x, outer, kernel):
+    # Computes ck @ kernel(outer(vk, x)) in blocks over x. The kernel is
+    # applied in place, so that each block needs a single intermediate array
+    ck = np.asarray(ck)
+    vk = np.asarray(vk)
+    x = np.asarray(x)
+
+    flat_x = x.ravel()
+    result = np.empty(
+        flat_x.shape, dtype=np.result_type(ck, vk, flat_x, 1.)
+    )
+    block = max(1, _EXP_SUM_BLOCK_SIZE // max(1, len(vk)))
+    for start in range(0, len(flat_x), block):
+        values = outer(vk, flat_x[start:start + block])
+        kernel(values, out=values)
+        result[start:start + block] = ck @ values
+    return result.reshape(x.shape)
+
+
+def _exponent_arrays(owner, exponents):
+    # Returns read-only arrays of the types, coefficients and exponents of
+    # the given CFExponents. The arrays from the previous call (stored on
+    # `owner`) are reused if the same exponent objects are passed again;
+    # since exponents are not modified after their creation, comparing
+    # identities is enough.
+    exponents = tuple(exponents)
+    cached = owner.__dict__.get("_exponent_arrays_cache")
+    if (
+        cached is not None
+        and len(cached[0]) == len(exponents)
+        and all(map(operator.is_, cached[0], exponents))
+    ):
+        return cached[1]
+
+    arrays = (
+        np.array([exp.type for exp in exponents], dtype=object),
+        np.array([exp.coefficient for exp in exponents], dtype=complex),
+        np.array([exp.exponent for exp in exponents], dtype=complex),
+    )
+    for array in arrays:
+        array.flags.writeable = False
+    owner._exponent_arrays_cache = (exponents, arrays)
+    return arrays
+
+
+def _smallest_eigvals_offdiag(offdiag, n):
+    """
+    Returns the `n` smallest eigenvalues (in ascending order) of the symmetric
+    tridiagonal matrix with zero diagonal and the given off-diagonal.
+    """
+    if n <= 0:
+        return np.array([])
+    return eigvalsh_tridiagonal(
+        np.zeros(len(offdiag) + 1), offdiag,
+        select='i', select_range=(0, n - 1)
+    )
+
+
+# Bernoulli numbers B_2, B_4, ..., B_20
+_BERNOULLI_2K = np.array([
+    1 / 6, -1 / 30, 1 / 42, -1 / 30, 5 / 66, -691 / 2730, 7 / 6,
+    -3617 / 510, 43867 / 798, -174611 / 330
+])
+_HURWITZ_DIRECT_TERMS = 16
+
+
+def _hurwitz_zeta(s, a):
+    r"""
+    Vectorized Hurwitz zeta function :math:`\zeta(s, a)` for real `s > 0`,
+    `s != 1` and complex `a` with positive real part, computed with the
+    Euler-Maclaurin formula. For small `|a|`, the first ``16 + ceil(s)``
+    terms of the series are summed directly and the tail is approximated by
+    its integral plus Bernoulli corrections. For large `|a|`, the asymptotic
+    expansion applies directly. The relative error is a few times the machine
+    epsilon for orders up to about 50 and grows slowly beyond, as the powers
+    `(a + k)^(-s)` themselves lose precision.
+    """
+    a = np.asarray(a, dtype=complex)
+    # the tail is only evaluated where |x| >= 16 + s, see _hurwitz_zeta_tail
+    n = _HURWITZ_DIRECT_TERMS + int(np.ceil(s))
+
+    result = np.empty_like(a)
+    large = np.abs(a) >= n
+    result[large] = _hurwitz_zeta_tail(s, a[large])
+
+    a_small = a[~large]
+    small_result = _hurwitz_zeta_tail(s, a_small + n)
+    for k in range(n):
+        small_result += (a_small + k) ** -s
+    result[~large] = small_result
+    return result
+
+
+def _hurwitz_zeta_tail(s, x):
+    # Euler-Maclaurin approximation of sum_{k >= 0} (x + k)^(-s). Successive
+    # Bernoulli corrections shrink by about ((s + 2k) / (2 pi |x|))^2, so ten
+    # of them reach double precision only for |x| >= 16 + s
+    result = x ** (1 - s) / (s - 1) + x ** -s / 2
+
+    # Bernoulli corrections B_2k / (2k)! * s (s+1) ... (s+2k-2) x^(-s-2k+1)
+    factor = s * x ** (-s - 1) / 2
+    x_inv2 = x ** -2
+    for k, b2k in enumerate(_BERNOULLI_2K, start=1):
+        result += b2k * factor
+        factor = factor * x_inv2 * (s + 2 * k - 1) * (s + 2 * k) / (
+            (2 * k + 1) * (2 * k + 2))
+    return result
+
+
+def _pade_kappa(eps, chi, prefactor):
+    r"""
+    Computes the Pade coefficients
+
+    .. math::
+
+        \kappa_j = p \frac{\prod_{k=1}^{N-1} (\chi_k^2 - \epsilon_j^2)}
+        {\prod_{k \neq j} (\epsilon_k^2 - \epsilon_j^2)}
+
+    for all `j` at once, where `p` is the given prefactor.
+    """
+    eps2 = np.asarray(eps, dtype=float)**2
+    chi2 = np.asarray(chi, dtype=float)**2
+    Nk = len(eps2)
+    if Nk == 0:
+        return np.array([])
+
+    # denominators[j, k] = eps_k^2 - eps_j^2, with ones on the diagonal
+    denominators = eps2[np.newaxis, :] - eps2[:, np.newaxis] + np.eye(Nk)
+    numerators = chi2[np.newaxis, :] - eps2[:, np.newaxis]
+    # all the ratios are of order one since the eps and chi interlace, so the
+    # products can be taken directly without over- or underflow
+    return prefactor * (
+        np.prod(numerators / denominators[:, :Nk - 1], axis=1)
+        / denominators[:, Nk - 1]
+    )
+
+
 def _real_interpolation(fun, xlist, name, args=None):
     args = args or {}
     if callable(fun):
@@ -2159,9 +2452,12 @@ def _complex_interpolation(fun, xlist, name, args=None):
     if callable(fun):
         return lambda t: fun(t, **args)
     else:
-        real_interp = _real_interpolation(np.real(fun), xlist, name)
-        imag_interp = _real_interpolation(np.imag(fun), xlist, name)
-        return lambda x: real_interp(x) + 1j * imag_interp(x)
+        # A single spline with complex values shares the knot solve between
+        # the real and imaginary parts and evaluates both in one pass
+        return _real_interpolation(np.asarray(fun, dtype=complex), xlist, name)
+
+
+_FFT_CACHE_SIZE = 16
 
 
 def _fft(f, wMax, tMax):
@@ -2180,7 +2476,8 @@ def _fft(f, wMax, tMax):
     The function f is sampled on the interval `[-tMax, tMax]`. The sampling
     discretization is chosen as `dt = pi / (4*wMax)` (Shannon-Nyquist + some
     leeway). However, `dt` is always chosen small enough to have at least 500
-    samples on the interval `[-tMax, tMax]`.
+    samples on the interval `[-tMax, tMax]`, and the number of samples is
+    rounded up to a length that the FFT handles efficiently.
 
     Parameters
     ----------
@@ -2196,33 +2493,89 @@ def _fft(f, wMax, tMax):
     """
     # Code adapted from https://stackoverflow.com/a/24077914
 
-    numSamples = int(
+    # rounded up to a length for which the FFT is efficient
+    numSamples = scipy.fft.next_fast_len(int(
         max(500, np.ceil(2 * tMax * 4 * wMax / np.pi + 1))
-    )
+    ))
     t, dt = np.linspace(-tMax, tMax, numSamples, retstep=True)
     f_values = f(t)
 
-    # Compute Fourier transform by numpy's FFT function
-    g = np.fft.fft(f_values)
+    # Compute Fourier transform by scipy's FFT function. For real input
+    # (e.g. a power spectrum) the transform is hermitian, so only half of it
+    # has to be computed. Complex arrays without imaginary part are treated
+    # as real as well.
+    if np.iscomplexobj(f_values) and not np.any(f_values.imag):
+        f_values = f_values.real
+    if np.isrealobj(f_values):
+        g_half = scipy.fft.rfft(f_values, workers=-1)
+        g = np.empty(numSamples, dtype=complex)
+        g[:len(g_half)] = g_half
+        g[len(g_half):] = np.conj(g_half[1:(numSamples + 1) // 2][::-1])
+    else:
+        g = scipy.fft.fft(f_values, workers=-1)
+    g = scipy.fft.fftshift(g)
     # frequency normalization factor is 2 * np.pi / dt
-    w = np.fft.fftfreq(numSamples) * 2 * np.pi / dt
+    w = scipy.fft.fftshift(scipy.fft.fftfreq(numSamples)) * 2 * np.pi / dt
     # In order to get a discretisation of the continuous Fourier transform
     # we need to multiply g by a phase factor
-    g *= dt * np.exp(1j * w * tMax)
-
-    return _complex_interpolation(
-        np.fft.fftshift(g), np.fft.fftshift(w), 'FFT'
+    g *= dt * _phase_progression(
+        2 * np.pi * tMax / (numSamples * dt), -(numSamples // 2), numSamples
     )
 
+    return _complex_interpolation(g, w, 'FFT')
+
+
+def _phase_progression(phi, k0, n):
+    """
+    Returns ``exp(1j * phi * k)`` for the integers ``k0 <= k < k0 + n``.
+    The progression is built as an outer product of a coarse and a fine
+    progression, which needs only ``~2 sqrt(n)`` complex exponentials and
+    keeps the rounding error at the level of a single multiplication
+    (unlike a running product).
+    """
+    block = max(1, int(np.ceil(np.sqrt(n))))
+    coarse = np.exp(1j * phi * (k0 + block * np.arange(-(-n // block))))
+    fine = np.exp(1j * phi * np.arange(block))
+    return np.multiply.outer(coarse, fine).ravel()[:n]
+
+
+def _cf_fit_model(tlist, a, b, c, d):
+    # sum_k (a_k + i d_k) exp((b_k + i c_k) |t|), for scalar or array
+    # parameters, evaluated as a matrix-vector product
+    ck = np.atleast_1d(a + 1j * d)
+    vk = np.atleast_1d(b + 1j * c)
+    # the exponential is taken in place, so that a single (N, T) array is
+    # allocated per evaluation
+    exponentials = np.multiply.outer(vk, np.abs(tlist))
+    np.exp(exponentials, out=exponentials)
+    return ck @ exponentials
 
+
+@_vectorized_model
 def _cf_real_fit_model(tlist, a, b, c, d=0):
-    return np.real((a + 1j * d) * np.exp((b + 1j * c) * np.abs(tlist)))
+    return np.real(_cf_fit_model(tlist, a, b, c, d))
 
 
+@_vectorized_model
 def _cf_imag_fit_model(tlist, a, b, c, d=0):
-    return np.sign(tlist) * np.imag(
-        (a + 1j * d) * np.exp((b + 1j * c) * np.abs(tlist))
-    )
+    return np.sign(tlist) * np.imag(_cf_fit_model(tlist, a, b, c, d))
+
+
+def _cf_fit_exponents(params):
+    # Each term (a + i d) exp((b + i c) |t|) of a fit of the real or imaginary
+    # part of the correlation function is the sum of two complex conjugate
+    # exponentials. Returns the coefficients (a + i d) / 2 and exponents
+    # -b - i c of the first exponential for all terms. Without the full
+    # ansatz, `params` has no column for d.
+    params = np.asarray(params)
+    a, b, c = params[:, 0], params[:, 1], params[:, 2]
+    d = params[:, 3] if params.shape[1] > 3 else 0
+    return (a + 1j * d) / 2, -b - 1j * c
+
+
+def _interleave(x, y):
+    # [x0, y0, x1, y1, ...]
+    return np.stack((x, y), axis=-1).ravel()
 
 
 def _default_guess_cfreal(tlist, clist, full_ansatz):
@@ -2268,10 +2621,15 @@ def _default_guess_cfimag(clist, full_ansatz):
     return guess, lower, upper
 
 
+@_vectorized_model
 def _sd_fit_model(wlist, a, b, c):
-    return (
-        2 * a * b * wlist / ((wlist + c)**2 + b**2) / ((wlist - c)**2 + b**2)
-    )
+    # for arrays of parameters, returns the sum of all terms
+    a, b, c = (np.atleast_1d(x)[:, np.newaxis] for x in (a, b, c))
+    # ((w + c)^2 + b^2) ((w - c)^2 + b^2) = w^4 + 2 (b^2 - c^2) w^2
+    #                                       + (b^2 + c^2)^2
+    w2 = wlist * wlist
+    denominator = w2 * (w2 + 2 * (b * b - c * c)) + (b * b + c * c)**2
+    return np.sum(2 * a * b * wlist / denominator, axis=0)
 
 
 def _default_guess_sd(wlist, jlist):
@@ -2289,9 +2647,13 @@ def _default_guess_sd(wlist, jlist):
     return guess, lower, upper
 
 
+@_vectorized_model
 def _ps_fit_model(wlist, a, b, c, d):
-    return (
-        2 * (a*c + b*(d-wlist)) / ((wlist - d)**2 + c**2)
+    # for arrays of parameters, returns the sum of all terms
+    a, b, c, d = (np.atleast_1d(x)[:, np.newaxis] for x in (a, b, c, d))
+    return np.sum(
+        2 * (a*c + b*(d-wlist)) / ((wlist - d)**2 + c**2),
+        axis=0
     )
 
 
@@ -2311,30 +2673,47 @@ def _default_guess_ps(wlist, jlist):
 def _fit_summary(time, rmse, N, label, params,
                  columns=['a', 'b', 'c']):
     # Generates summary of fit by nonlinear least squares
+    return "\n".join(
+        _fit_summary_lines(time, rmse, N, label, params, columns)
+    )
+
+
+def _fit_summary_lines(time, rmse, N, label, params, columns):
+    # The lines of the summary generated by `_fit_summary`
     if len(columns) == 3:
-        summary = (f"Result of fitting {label} "
-                   f"with {N} terms: \n \n {'Parameters': <10}|"
-                   f"{columns[0]: ^10}|{columns[1]: ^10}|{columns[2]: >5} \n ")
-        for k in range(N):
-            summary += (
-                f"{k + 1: <10}|{params[k][0]: ^10.2e}|{params[k][1]:^10.2e}|"
-                f"{params[k][2]:>5.2e}\n ")
+        header = (
+            f" {'Parameters': <10}|"
+            f"{columns[0]: ^10}|{columns[1]: ^10}|{columns[2]: >5} "
+        )
     elif len(columns) == 4:
-        summary = (
-            f"Result of fitting {label} "
-            f"with {N} terms: \n \n {'Parameters': <10}|"
+        header = (
+            f" {'Parameters': <10}|"
             f"{columns[0]: ^10}|{columns[1]: ^10}|{columns[2]: ^10}"
-            f"|{columns[3]: >5} \n ")
-        for k in range(N):
-            summary += (
-                f"{k + 1: <10}|{params[k][0]: ^10.2e}|{params[k][1]:^10.2e}"
-                f"|{params[k][2]:^10.2e}|{params[k][3]:>5.2e}\n ")
+            f"|{columns[3]: >5} "
+        )
     else:
         raise ValueError("Unsupported number of columns")
-    summary += (f"\nA RMSE of {rmse: .2e}"
-                f" was obtained for the {label}.\n")
-    summary += f"The current fit took {time: 2f} seconds."
-    return summary
+
+    # the label may contain line breaks
+    lines = f"Result of fitting {label} with {N} terms: ".split("\n")
+    lines += [" ", header]
+    if len(columns) == 3:
+        for k, row in enumerate(params[:N], 1):
+            lines.append(
+                f" {k: <10}|{row[0]: ^10.2e}|{row[1]:^10.2e}|{row[2]:>5.2e}"
+            )
+    else:
+        for k, row in enumerate(params[:N], 1):
+            lines.append(
+                f" {k: <10}|{row[0]: ^10.2e}|{row[1]:^10.2e}"
+                f"|{row[2]:^10.2e}|{row[3]:>5.2e}"
+            )
+    lines.append(" ")
+    lines += (
+        f"A RMSE of {rmse: .2e} was obtained for the {label}.".split("\n")
+    )
+    lines.append(f"The current fit took {time:.2f} seconds.")
+    return lines
 
 
 def _cf_fit_summary(
@@ -2345,40 +2724,35 @@ def _cf_fit_summary(
     columns = ["ckr", "vkr", "vki"]
     if n == 4:
         columns.append("cki")
-    summary_real = _fit_summary(
+    lines_real = _fit_summary_lines(
         fit_time_real, rmse_real, Nr,
         "the real part of\nthe correlation function",
-        params_real, columns=columns
+        params_real, columns
     )
-    summary_imag = _fit_summary(
+    lines_imag = _fit_summary_lines(
         fit_time_imag, rmse_imag, Ni,
         "the imaginary part\nof the correlation function",
-        params_imag, columns=columns
+        params_imag, columns
     )
 
-    full_summary = "Correlation function fit:\n\n"
-    lines_real = summary_real.splitlines()
-    lines_imag = summary_imag.splitlines()
-    max_lines = max(len(lines_real), len(lines_imag))
-    # Fill the shorter string with blank lines
-    lines_real = (
-        lines_real[:-1]
-        + (max_lines - len(lines_real)) * [""] + [lines_real[-1]]
-    )
-    lines_imag = (
-        lines_imag[:-1]
-        + (max_lines - len(lines_imag)) * [""] + [lines_imag[-1]]
-    )
     # Find the maximum line length in each column
     max_length1 = max(len(line) for line in lines_real)
     max_length2 = max(len(line) for line in lines_imag)
 
-    # Print the strings side by side with a vertical bar separator
-    for line1, line2 in zip(lines_real, lines_imag):
-        formatted_line1 = f"{line1:<{max_length1}} |"
-        formatted_line2 = f"{line2:<{max_length2}}"
-        full_summary += formatted_line1 + formatted_line2 + "\n"
-    return full_summary
+    # Print the strings side by side with a vertical bar separator, filling
+    # the shorter body with blank lines so that the footers stay aligned
+    *body_real, footer_real = lines_real
+    *body_imag, footer_imag = lines_imag
+    parts = ["Correlation function fit:\n\n"]
+    for line1, line2 in zip_longest(body_real, body_imag, fillvalue=""):
+        parts.append(
+            f"{line1.ljust(max_length1)} |{line2.ljust(max_length2)}\n"
+        )
+    parts.append(
+        f"{footer_real.ljust(max_length1)} |"
+        f"{footer_imag.ljust(max_length2)}\n"
+    )
+    return "".join(parts)
 
 
 # --- fermionic environments ---
@@ -2636,8 +3010,7 @@ class LorentzianEnvironment(FermionicEnvironment):
         abs_t = np.abs(t)
         c, v = self._corr(Nk, sigma)
 
-        result = np.sum([ck * np.exp(-np.asarray(vk * abs_t))
-                         for ck, vk in zip(c, v)], axis=0)
+        result = _exp_sum(c, v, abs_t)
 
         result = np.asarray(result, dtype=complex)
         result[t < 0] = np.conj(result[t < 0])
@@ -2751,21 +3124,17 @@ class LorentzianEnvironment(FermionicEnvironment):
         def f(x):
             return 1 / (np.exp(x / self.T) + 1)
 
-        coeff_list = [(
-            self.W * self.gamma / 2 *
-            f(sigma * (self.omega0 - self.mu) + 1j * self.W)
-        )]
-        exp_list = [self.W - sigma * 1j * self.omega0]
-
-        xk_list = [(2 * k - 1) * np.pi * self.T for k in range(1, Nk + 1)]
-        for xk in xk_list:
-            coeff_list.append(
-                1j * self.gamma * self.W**2 * self.T /
-                ((sigma * xk - 1j * self.mu + 1j * self.omega0)**2 - self.W**2)
-            )
-            exp_list.append(
-                xk - sigma * 1j * self.mu
-            )
+        xk = (2 * np.arange(1, Nk + 1) - 1) * np.pi * self.T
+        coeff_list = np.concatenate((
+            [self.W * self.gamma / 2
+             * f(sigma * (self.omega0 - self.mu) + 1j * self.W)],
+            1j * self.gamma * self.W**2 * self.T /
+            ((sigma * xk - 1j * self.mu + 1j * self.omega0)**2 - self.W**2)
+        ))
+        exp_list = np.concatenate((
+            [self.W - sigma * 1j * self.omega0],
+            xk - sigma * 1j * self.mu
+        ))
 
         return coeff_list, exp_list
 
@@ -2774,72 +3143,51 @@ class LorentzianEnvironment(FermionicEnvironment):
     def _corr(self, Nk, sigma):
         beta = 1 / self.T
         kappa, epsilon = self._kappa_epsilon(Nk)
+        kappa = kappa[1:]
+        epsilon = epsilon[1:]
 
         def f_approx(x):
-            f = 0.5
-            for ll in range(1, Nk + 1):
-                f = f - 2 * kappa[ll] * x / (x**2 + epsilon[ll]**2)
-            return f
-
-        eta_list = [(0.5 * self.gamma * self.W *
-                     f_approx(beta * sigma * (self.omega0 - self.mu)
-                              + beta * 1j * self.W))]
-        gamma_list = [self.W - sigma * 1.0j * self.omega0]
-
-        for ll in range(1, Nk + 1):
-            eta_list.append(
-                -1.0j * (kappa[ll] / beta) * self.gamma * self.W**2
-                / ((self.mu - self.omega0 + sigma * 1j * epsilon[ll] / beta)**2
-                   + self.W**2)
-            )
-            gamma_list.append(epsilon[ll] / beta - sigma * 1.0j * self.mu)
+            return 0.5 - np.sum(2 * kappa * x / (x**2 + epsilon**2))
+
+        eta_list = np.concatenate((
+            [0.5 * self.gamma * self.W
+             * f_approx(beta * sigma * (self.omega0 - self.mu)
+                        + beta * 1j * self.W)],
+            -1.0j * (kappa / beta) * self.gamma * self.W**2
+            / ((self.mu - self.omega0 + sigma * 1j * epsilon / beta)**2
+               + self.W**2)
+        ))
+        gamma_list = np.concatenate((
+            [self.W - sigma * 1.0j * self.omega0],
+            epsilon / beta - sigma * 1.0j * self.mu
+        ))
 
         return eta_list, gamma_list
 
+    @_cached_on_params()
     def _kappa_epsilon(self, Nk):
         eps = self._calc_eps(Nk)
         chi = self._calc_chi(Nk)
 
-        kappa = [0]
         prefactor = 0.5 * Nk * (2 * (Nk + 1) - 1)
-        for j in range(Nk):
-            term = prefactor
-            for k in range(Nk - 1):
-                term *= (
-                    (chi[k]**2 - eps[j]**2) /
-                    (eps[k]**2 - eps[j]**2 + self._delta(j, k))
-                )
-            for k in [Nk - 1]:
-                term /= (eps[k]**2 - eps[j]**2 + self._delta(j, k))
-            kappa.append(term)
-
-        epsilon = [0] + eps
+        kappa = np.concatenate(([0], _pade_kappa(eps, chi, prefactor)))
+        epsilon = np.concatenate(([0], eps))
 
         return kappa, epsilon
 
-    def _delta(self, i, j):
-        return 1.0 if i == j else 0.0
-
     def _calc_eps(self, Nk):
-        alpha = np.diag([
-            1. / np.sqrt((2 * k + 3) * (2 * k + 1))
-            for k in range(2 * Nk - 1)
-        ], k=1)
-        alpha += alpha.transpose()
-
-        evals = eigvalsh(alpha)
-        eps = [-2. / val for val in evals[0: Nk]]
-        return eps
+        k = np.arange(2 * Nk - 1)
+        evals = _smallest_eigvals_offdiag(
+            1. / np.sqrt((2 * k + 3) * (2 * k + 1)), Nk
+        )
+        return -2. / evals
 
     def _calc_chi(self, Nk):
-        alpha_p = np.diag([
-            1. / np.sqrt((2 * k + 5) * (2 * k + 3))
-            for k in range(2 * Nk - 2)
-        ], k=1)
-        alpha_p += alpha_p.transpose()
-        evals = eigvalsh(alpha_p)
-        chi = [-2. / val for val in evals[0: Nk - 1]]
-        return chi
+        k = np.arange(2 * Nk - 2)
+        evals = _smallest_eigvals_offdiag(
+            1. / np.sqrt((2 * k + 5) * (2 * k + 3)), Nk - 1
+        )
+        return -2. / evals
 
 
 class ExponentialFermionicEnvironment(FermionicEnvironment):
@@ -2935,9 +3283,11 @@ class ExponentialFermionicEnvironment(FermionicEnvironment):
 
         self.exponents = exponents or []
         if lists_provided:
-            self.exponents.extend(CFExponent("+", ck, vk, tag=tag)
+            # see ExponentialBosonicEnvironment.__init__
+            plus, minus = CFExponent.types["+"], CFExponent.types["-"]
+            self.exponents.extend(CFExponent(plus, ck, vk, tag=tag)
                                   for ck, vk in zip(ck_plus, vk_plus))
-            self.exponents.extend(CFExponent("-", ck, vk, tag=tag)
+            self.exponents.extend(CFExponent(minus, ck, vk, tag=tag)
                                   for ck, vk in zip(ck_minus, vk_minus))
 
     def spectral_density(self, w: float | ArrayLike) -> (float | ArrayLike):
@@ -2985,11 +3335,9 @@ class ExponentialFermionicEnvironment(FermionicEnvironment):
 
     def _cf(self, t, type):
         t = np.asarray(t, dtype=float)
-        corr = np.zeros_like(t, dtype=complex)
+        ck, vk = self._coefficients_and_exponents(type)
 
-        for exp in self.exponents:
-            if exp.type == type:
-                corr += exp.coefficient * np.exp(-exp.exponent * np.abs(t))
+        corr = np.asarray(_exp_sum(ck, vk, np.abs(t)), dtype=np.complex128)
         corr[t < 0] = np.conj(corr[t < 0])
 
         return corr.item() if t.ndim == 0 else corr
@@ -3026,16 +3374,19 @@ class ExponentialFermionicEnvironment(FermionicEnvironment):
 
     def _ps(self, w, type, sigma):
         w = np.asarray(w, dtype=float)
-        S = np.zeros_like(w)
+        ck, vk = self._coefficients_and_exponents(type)
 
-        for exp in self.exponents:
-            if exp.type == type:
-                S += 2 * np.real(
-                    exp.coefficient / (exp.exponent + sigma * 1j * w)
-                )
+        # vk + sigma i w = vk - i (-sigma w)
+        S = 2 * np.real(_pole_sum(ck, vk, -sigma * w))
 
         return S.item() if w.ndim == 0 else S
 
+    def _coefficients_and_exponents(self, type):
+        # see ExponentialBosonicEnvironment._coefficients_and_exponents
+        types, ck, vk = _exponent_arrays(self, self.exponents)
+        mask = types == type
+        return ck[mask], vk[mask]
+
     def rescale(
         self, alpha: float, tag: Any = None
     ) -> ExponentialFermionicEnvironment: